@@ -20,6 +20,18 @@ from app.models import Base
 from app.models.all_models import *  # Import all models to ensure they're registered
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave dialect-specific indexes (Index.ddl_if) out of autogenerate on other dialects"""
+    if type_ == "index" and not reflected:
+        ddl_if = object._ddl_if
+        if ddl_if is not None and ddl_if.dialect is not None:
+            dialect = context.get_context().dialect.name
+            targets = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+            return dialect in targets
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -42,6 +54,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -65,7 +78,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,68 @@
+"""Use JSONB and GIN indexes for JSON list columns on PostgreSQL
+
+Revision ID: 4b7c2e91d5a3
+Revises: e988348448f4
+Create Date: 2026-10-14 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7c2e91d5a3'
+down_revision: Union[str, None] = 'e988348448f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# JSON columns stored as JSONB on PostgreSQL (SQLite keeps plain JSON)
+JSON_COLUMNS = {
+    'predictions': ['symptom_list', 'pmh_list', 'predictions'],
+    'medications': ['brand_names', 'contraindications', 'side_effects'],
+    'training_data': ['symptom_list', 'pmh_list', 'current_medications', 'allergies', 'target_tests', 'target_medications'],
+    'validation_data': ['symptom_list', 'pmh_list', 'current_medications', 'allergies', 'target_tests', 'target_medications'],
+    'clinical_feedback': ['ordered_tests', 'prescribed_medications'],
+    'clinical_outcomes': ['side_effects', 'complications'],
+}
+
+# (index name, table, column) for containment queries
+GIN_INDEXES = [
+    ('ix_training_symptoms_gin', 'training_data', 'symptom_list'),
+    ('ix_training_pmh_gin', 'training_data', 'pmh_list'),
+    ('ix_training_target_tests_gin', 'training_data', 'target_tests'),
+    ('ix_training_target_medications_gin', 'training_data', 'target_medications'),
+    ('ix_validation_symptoms_gin', 'validation_data', 'symptom_list'),
+    ('ix_validation_pmh_gin', 'validation_data', 'pmh_list'),
+    ('ix_validation_target_tests_gin', 'validation_data', 'target_tests'),
+    ('ix_validation_target_medications_gin', 'validation_data', 'target_medications'),
+    ('ix_feedback_ordered_tests_gin', 'clinical_feedback', 'ordered_tests'),
+    ('ix_feedback_prescribed_medications_gin', 'clinical_feedback', 'prescribed_medications'),
+]
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=postgresql.JSONB(), postgresql_using=f'{column}::jsonb')
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=sa.JSON(), postgresql_using=f'{column}::json')
@@ -0,0 +1,82 @@
+"""Add symptom dictionary and training_symptoms junction table
+
+Revision ID: 9d3f6a8b2c14
+Revises: 4b7c2e91d5a3
+Create Date: 2026-10-14 18:30:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6a8b2c14'
+down_revision: Union[str, None] = '4b7c2e91d5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('symptoms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_symptoms_id'), 'symptoms', ['id'], unique=False)
+    op.create_index(op.f('ix_symptoms_name'), 'symptoms', ['name'], unique=True)
+    op.create_table('training_symptoms',
+    sa.Column('training_id', sa.Integer(), nullable=False),
+    sa.Column('symptom_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['symptom_id'], ['symptoms.id'], ),
+    sa.ForeignKeyConstraint(['training_id'], ['training_data.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('training_id', 'symptom_id')
+    )
+    op.create_index(op.f('ix_training_symptoms_symptom_id'), 'training_symptoms', ['symptom_id'], unique=False)
+
+    if not op.get_context().as_sql:
+        _backfill_training_symptoms()
+
+
+def _backfill_training_symptoms() -> None:
+    """Link existing training samples to their (normalized) symptoms"""
+    bind = op.get_bind()
+    rows = bind.execute(sa.text('SELECT id, symptom_list FROM training_data')).fetchall()
+
+    names_by_sample = {}
+    for training_id, symptom_list in rows:
+        if isinstance(symptom_list, str):
+            symptom_list = json.loads(symptom_list)
+        names = []
+        for symptom in symptom_list or []:
+            if isinstance(symptom, str):
+                name = symptom.lower().strip()
+                if name and name not in names:
+                    names.append(name)
+        names_by_sample[training_id] = names
+
+    all_names = sorted({name for names in names_by_sample.values() for name in names})
+    if not all_names:
+        return
+
+    # Let the database assign symptom ids, then read them back
+    symptoms_table = sa.table('symptoms', sa.column('name', sa.String))
+    op.bulk_insert(symptoms_table, [{'name': name} for name in all_names])
+    symptom_ids = {name: symptom_id for symptom_id, name in bind.execute(sa.text('SELECT id, name FROM symptoms'))}
+
+    links_table = sa.table('training_symptoms', sa.column('training_id', sa.Integer), sa.column('symptom_id', sa.Integer))
+    op.bulk_insert(links_table, [
+        {'training_id': training_id, 'symptom_id': symptom_ids[name]}
+        for training_id, names in names_by_sample.items()
+        for name in names
+    ])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_training_symptoms_symptom_id'), table_name='training_symptoms')
+    op.drop_table('training_symptoms')
+    op.drop_index(op.f('ix_symptoms_name'), table_name='symptoms')
+    op.drop_index(op.f('ix_symptoms_id'), table_name='symptoms')
+    op.drop_table('symptoms')
@@ -0,0 +1,42 @@
+"""Add covering indexes for feedback and outcome summaries on PostgreSQL
+
+Revision ID: c5e81f0a7b26
+Revises: 9d3f6a8b2c14
+Create Date: 2026-10-14 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e81f0a7b26'
+down_revision: Union[str, None] = '9d3f6a8b2c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, key column, INCLUDE columns)
+COVERING_INDEXES = [
+    ('ix_cf_pred_cover', 'clinical_feedback', 'prediction_id',
+     ['prediction_accurate', 'actual_condition_name', 'confidence_in_feedback']),
+    ('ix_co_pred_cover', 'clinical_outcomes', 'prediction_id',
+     ['treatment_effective', 'final_condition_name']),
+]
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, column, include in COVERING_INDEXES:
+        op.create_index(name, table, [column], unique=False, postgresql_include=include)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, _, _ in COVERING_INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,43 @@
+"""Use a native sex_enum type for sex columns on PostgreSQL
+
+Revision ID: e2a4d6f8b013
+Revises: c5e81f0a7b26
+Create Date: 2026-10-14 19:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4d6f8b013'
+down_revision: Union[str, None] = 'c5e81f0a7b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEX_TABLES = ['patients', 'predictions', 'training_data', 'validation_data']
+
+sex_enum = postgresql.ENUM('male', 'female', 'other', name='sex_enum', create_type=False)
+
+
+def upgrade() -> None:
+    # SQLite keeps VARCHAR; the ORM Enum type needs no schema change there
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE TYPE sex_enum AS ENUM ('male', 'female', 'other')")
+    for table in SEX_TABLES:
+        op.alter_column(table, 'sex', type_=sex_enum, postgresql_using='lower(sex)::sex_enum')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table in SEX_TABLES:
+        op.alter_column(table, 'sex', type_=sa.String(), postgresql_using='sex::text')
+    op.execute('DROP TYPE sex_enum')
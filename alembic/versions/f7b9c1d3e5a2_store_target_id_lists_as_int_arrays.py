@@ -0,0 +1,58 @@
+"""Store target test/medication ID lists as integer arrays on PostgreSQL
+
+Revision ID: f7b9c1d3e5a2
+Revises: e2a4d6f8b013
+Create Date: 2026-10-14 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9c1d3e5a2'
+down_revision: Union[str, None] = 'e2a4d6f8b013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column); the jsonb_ops GIN indexes are rebuilt with array_ops
+ARRAY_COLUMNS = [
+    ('ix_training_target_tests_gin', 'training_data', 'target_tests'),
+    ('ix_training_target_medications_gin', 'training_data', 'target_medications'),
+    ('ix_validation_target_tests_gin', 'validation_data', 'target_tests'),
+    ('ix_validation_target_medications_gin', 'validation_data', 'target_medications'),
+]
+
+
+def upgrade() -> None:
+    # SQLite keeps JSON lists
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # ALTER ... USING can't contain a subquery, so unpack the JSONB array through a helper
+    op.execute(
+        "CREATE FUNCTION pg_temp.jsonb_to_int_array(value jsonb) RETURNS integer[] "
+        "LANGUAGE sql IMMUTABLE AS $$ "
+        "SELECT coalesce(array_agg(element::integer), '{}') FROM jsonb_array_elements_text(value) AS element "
+        "$$"
+    )
+    for name, table, column in ARRAY_COLUMNS:
+        op.drop_index(name, table_name=table)
+        op.alter_column(table, column, type_=postgresql.ARRAY(sa.Integer()),
+                        postgresql_using=f'pg_temp.jsonb_to_int_array({column})')
+        op.create_index(name, table, [column], unique=False, postgresql_using='gin')
+    op.execute('DROP FUNCTION pg_temp.jsonb_to_int_array(jsonb)')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, table, column in ARRAY_COLUMNS:
+        op.drop_index(name, table_name=table)
+        op.alter_column(table, column, type_=postgresql.JSONB(), postgresql_using=f'to_jsonb({column})')
+        op.create_index(name, table, [column], unique=False, postgresql_using='gin')
@@ -3,8 +3,9 @@ Clinical Feedback API Endpoints
 Handles doctor feedback on predictions and clinical outcomes
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Response, status
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, defer, load_only
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -35,8 +36,10 @@ async def submit_prediction_feedback(
     The feedback is stored and can be used to improve the model.
     """
     
-    # Verify prediction exists (or create a mock one for testing)
-    prediction = db.query(Prediction).filter(Prediction.id == feedback.prediction_id).first()
+    # Verify prediction exists (or create a mock one for testing); notes text isn't needed
+    prediction = db.query(Prediction).options(defer(Prediction.free_text_notes)).filter(
+        Prediction.id == feedback.prediction_id
+    ).first()
     if not prediction:
         # For testing purposes, create a mock prediction entry
         # In production, this should return an error
@@ -147,19 +150,17 @@ async def submit_prediction_feedback(
                     # Log error but don't fail the feedback submission
                     print(f"Warning: Could not add training data: {e}")
         
-        # Calculate summary statistics
-        total_feedback = db.query(ClinicalFeedback).filter(
+        # Calculate summary statistics in a single aggregate query
+        total_feedback, accurate_feedback = db.query(
+            func.count(),
+            func.coalesce(func.sum(case((ClinicalFeedback.prediction_accurate, 1), else_=0)), 0)
+        ).filter(
             ClinicalFeedback.prediction_id == feedback.prediction_id
-        ).count()
-        
-        accurate_feedback = db.query(ClinicalFeedback).filter(
-            ClinicalFeedback.prediction_id == feedback.prediction_id,
-            ClinicalFeedback.prediction_accurate == True
-        ).count()
+        ).one()
         
         accuracy_rate = (accurate_feedback / total_feedback) if total_feedback > 0 else 0.0
         
-        return FeedbackResponse(
+        response = FeedbackResponse(
             message="Feedback submitted successfully",
             feedback_id=feedback_record.id,
             training_data_added=training_data_added,
@@ -167,6 +168,7 @@ async def submit_prediction_feedback(
             total_feedback_for_prediction=total_feedback,
             prediction_accuracy_rate=accuracy_rate
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         db.rollback()
@@ -193,8 +195,10 @@ async def submit_clinical_outcome(
     including treatment effectiveness and patient recovery.
     """
     
-    # For testing, we'll create a mock prediction if it doesn't exist
-    prediction = db.query(Prediction).filter(Prediction.id == outcome.prediction_id).first()
+    # For testing, we'll create a mock prediction if it doesn't exist; only existence is checked
+    prediction = db.query(Prediction).options(load_only(Prediction.id)).filter(
+        Prediction.id == outcome.prediction_id
+    ).first()
     if not prediction:
         print(f"Warning: Prediction ID {outcome.prediction_id} not found, creating mock entry for testing")
         
@@ -299,40 +303,41 @@ async def get_feedback_summary(
     Get summary of all feedback for a prediction
     """
     
-    feedback_records = db.query(ClinicalFeedback).filter(
+    # Counts and average in one aggregate over the ix_cf_pred_cover columns
+    total_count, accurate_count, avg_confidence = db.query(
+        func.count(),
+        func.sum(case((ClinicalFeedback.prediction_accurate, 1), else_=0)),
+        func.avg(ClinicalFeedback.confidence_in_feedback)
+    ).filter(
         ClinicalFeedback.prediction_id == prediction_id
-    ).all()
+    ).one()
     
-    if not feedback_records:
+    if not total_count:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No feedback found for prediction {prediction_id}"
         )
     
-    total_count = len(feedback_records)
-    accurate_count = sum(1 for f in feedback_records if f.prediction_accurate)
     accuracy_rate = accurate_count / total_count
     
-    # Find most common actual diagnosis (if prediction was wrong)
-    incorrect_feedback = [f for f in feedback_records if not f.prediction_accurate]
+    # Find most common actual diagnosis (if prediction was wrong); ties go to the earliest feedback
     most_common_diagnosis = None
     
-    if incorrect_feedback:
-        diagnosis_counts = {}
-        for f in incorrect_feedback:
-            if f.actual_condition_name:
-                diagnosis_counts[f.actual_condition_name] = diagnosis_counts.get(f.actual_condition_name, 0) + 1
-        
-        if diagnosis_counts:
-            most_common_diagnosis = max(diagnosis_counts.items(), key=lambda x: x[1])[0]
+    if accurate_count < total_count:
+        most_common_diagnosis = db.query(ClinicalFeedback.actual_condition_name).filter(
+            ClinicalFeedback.prediction_id == prediction_id,
+            ClinicalFeedback.prediction_accurate == False,
+            ClinicalFeedback.actual_condition_name != ''
+        ).group_by(
+            ClinicalFeedback.actual_condition_name
+        ).order_by(
+            func.count().desc(), func.min(ClinicalFeedback.id)
+        ).limit(1).scalar()
     
     # Calculate consensus (>= 80% agreement)
     consensus_reached = accuracy_rate >= 0.8 or (1 - accuracy_rate) >= 0.8
     
-    # Average feedback quality based on confidence
-    avg_confidence = sum(f.confidence_in_feedback for f in feedback_records) / total_count
-    
-    return FeedbackSummary(
+    summary = FeedbackSummary(
         prediction_id=prediction_id,
         total_feedback_count=total_count,
         accuracy_rate=accuracy_rate,
@@ -342,6 +347,8 @@ async def get_feedback_summary(
         most_common_medications=[],    # Would need more complex analysis
         feedback_quality_score=avg_confidence
     )
+    # Serialize once in pydantic-core; skips FastAPI re-validating the response model
+    return Response(content=summary.model_dump_json(), media_type="application/json")
 
 
 @router.post("/add-training-data")
@@ -433,7 +440,13 @@ async def get_feedback_statistics(
     
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    recent_feedback = db.query(ClinicalFeedback).filter(
+    # Only the aggregated columns; skips the clinical/outcome notes text
+    recent_feedback = db.query(
+        ClinicalFeedback.prediction_id,
+        ClinicalFeedback.doctor_id,
+        ClinicalFeedback.prediction_accurate,
+        ClinicalFeedback.confidence_in_feedback
+    ).filter(
         ClinicalFeedback.created_at >= cutoff_date
     ).all()
     
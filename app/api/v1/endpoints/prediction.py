@@ -2,7 +2,7 @@
 Prediction endpoints for disease prediction and clinical decision support
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
 import time
@@ -59,9 +59,9 @@ def save_prediction_to_db(
             # Convert predictions to JSON-serializable format
             predictions_dict = []
             for pred in predictions:
-                if hasattr(pred, 'dict'):
+                if hasattr(pred, 'model_dump'):
                     # It's a Pydantic model, convert to dict
-                    predictions_dict.append(pred.dict())
+                    predictions_dict.append(pred.model_dump())
                 else:
                     # It's already a dict
                     predictions_dict.append(pred)
@@ -131,7 +131,7 @@ async def predict_disease(
         print(f"🤖 ML predictor obtained")
         
         # Convert request to dict for processing
-        request_dict = request.dict()
+        request_dict = request.model_dump()
         print(f"📄 Request converted to dict with {len(request_dict)} keys")
         
         # Generate predictions using ML model
@@ -165,7 +165,8 @@ async def predict_disease(
         )
         print(f"✅ Background task added successfully")
 
-        return response
+        # Serialize once in pydantic-core; skips FastAPI re-validating the response model
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         processing_time = (time.time() - start_time) * 1000
@@ -190,7 +191,16 @@ async def get_prediction_history(
     Get prediction history for a specific patient
     """
     try:
-        predictions = db.query(Prediction).filter(
+        # Project only the returned columns so the notes text is never fetched
+        predictions = db.query(
+            Prediction.id,
+            Prediction.age,
+            Prediction.sex,
+            Prediction.predictions,
+            Prediction.model_version,
+            Prediction.processing_time_ms,
+            Prediction.created_at
+        ).filter(
             Prediction.patient_id == patient_id
         ).order_by(Prediction.created_at.desc()).all()
         
@@ -2,13 +2,64 @@
 Database configuration and connection management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url, Index, Integer, JSON
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import os
+import sqlite3
+from typing import List
 from app.config import settings
 
+# orjson encodes/decodes JSON columns several times faster; stdlib json otherwise
+try:
+    import orjson
+    
+    def _json_serializer(value) -> str:
+        return orjson.dumps(value).decode()
+    
+    _json_deserializer = orjson.loads
+except ImportError:
+    import json
+    
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
+
+# create_engine() options for any engine that should use the same JSON codec as the app
+JSON_CODEC_OPTIONS = {"json_serializer": _json_serializer, "json_deserializer": _json_deserializer}
+
+# Per-connection SQLite tuning for the helper scripts (the app engine keeps SQLite defaults):
+# WAL lets readers run alongside a writer, and NORMAL sync drops the extra fsync per
+# commit (durable across app crashes, not power loss)
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """
+    Apply the SQLite PRAGMAs to a DB-API connection; usable as an engine "connect" listener
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """
+    Open a tuned, autocommit sqlite3 connection for the helper scripts
+    """
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    apply_sqlite_pragmas(conn)
+    return conn
+
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
@@ -16,7 +67,11 @@ engine = create_engine(
     connect_args={
         "check_same_thread": False  # For SQLite compatibility if needed
     } if "sqlite" in settings.database_url else {},
-    echo=settings.debug
+    echo=settings.debug,
+    **JSON_CODEC_OPTIONS,
+    # Batch ORM/Core executemany INSERTs into large multi-row VALUES statements
+    insertmanyvalues_page_size=10_000,
+    **({"executemany_mode": "values_plus_batch"} if make_url(settings.database_url).get_driver_name() == "psycopg2" else {})
 )
 
 # Create SessionLocal class
@@ -25,6 +80,26 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create Base class for models
 Base = declarative_base()
 
+# JSON column type: binary JSONB on PostgreSQL (GIN-indexable), plain JSON elsewhere (SQLite dev)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Integer ID lists: packed int4[] on PostgreSQL (GIN-indexable, no JSON parsing), JSON list elsewhere
+IntArrayType = JSON().with_variant(ARRAY(Integer), "postgresql")
+
+
+def gin_index(name: str, column: str) -> Index:
+    """
+    GIN index on a JSONB column for containment (@>) queries; only emitted on PostgreSQL
+    """
+    return Index(name, column, postgresql_using="gin").ddl_if(dialect="postgresql")
+
+
+def covering_index(name: str, column: str, include: List[str]) -> Index:
+    """
+    B-tree index carrying extra INCLUDE columns for index-only scans; only emitted on PostgreSQL
+    """
+    return Index(name, column, postgresql_include=include).ddl_if(dialect="postgresql")
+
 
 def get_db():
     """
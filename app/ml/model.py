@@ -126,7 +126,7 @@ class ClinicalDecisionModel(nn.Module):
         Get top-k disease predictions
         """
         self.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.forward(x)
             disease_probs = outputs["disease_probabilities"]
             
@@ -146,7 +146,7 @@ class ClinicalDecisionModel(nn.Module):
         Get recommended tests above threshold
         """
         self.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.forward(x)
             test_probs = outputs["test_probabilities"]
             
@@ -165,7 +165,7 @@ class ClinicalDecisionModel(nn.Module):
         Get recommended medications above threshold
         """
         self.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.forward(x)
             med_probs = outputs["medication_probabilities"]
             
@@ -184,7 +184,7 @@ class ClinicalDecisionModel(nn.Module):
         Get overall assessment confidence
         """
         self.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.forward(x)
             return outputs["assessment_confidence"][0][0].item()
 
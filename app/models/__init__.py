@@ -2,10 +2,13 @@
 Database models for the Clinical Decision Support System
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, Enum, ForeignKey, Table, event, insert, select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from app.database import Base
+from sqlalchemy.orm import relationship, Session
+from app.database import Base, IntArrayType, JSONType, gin_index
+
+# Closed sex vocabulary (matches schemas.SexEnum): a native enum on PostgreSQL, VARCHAR on SQLite
+SexType = Enum("male", "female", "other", name="sex_enum")
 
 
 class Patient(Base):
@@ -17,7 +20,7 @@ class Patient(Base):
     id = Column(Integer, primary_key=True, index=True)
     patient_id = Column(String, unique=True, index=True)
     age = Column(Integer)
-    sex = Column(String)
+    sex = Column(SexType)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -33,17 +36,17 @@ class Prediction(Base):
     
     # Input data
     age = Column(Integer)
-    sex = Column(String)
+    sex = Column(SexType)
     vital_temperature_c = Column(Float)
     vital_heart_rate = Column(Integer)
     vital_blood_pressure_systolic = Column(Integer, nullable=True)
     vital_blood_pressure_diastolic = Column(Integer, nullable=True)
-    symptom_list = Column(JSON)
-    pmh_list = Column(JSON)
+    symptom_list = Column(JSONType)
+    pmh_list = Column(JSONType)
     free_text_notes = Column(Text)
     
     # Predictions (top 3)
-    predictions = Column(JSON)
+    predictions = Column(JSONType)
     
     # Metadata
     model_version = Column(String)
@@ -53,9 +56,8 @@ class Prediction(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
-    # Note: Relationships with feedback models commented out to avoid circular imports
-    # feedback = relationship("ClinicalFeedback", back_populates="prediction")
-    # outcomes = relationship("ClinicalOutcomeRecord", back_populates="prediction")
+    # Note: feedback/outcomes relationships are attached in app.models.all_models
+    # to avoid circular imports
 
 
 class ICD10Code(Base):
@@ -97,15 +99,35 @@ class Medication(Base):
     id = Column(Integer, primary_key=True, index=True)
     medication_name = Column(String, index=True)
     generic_name = Column(String)
-    brand_names = Column(JSON)
+    brand_names = Column(JSONType)
     drug_class = Column(String)
     typical_dosage = Column(String)
-    contraindications = Column(JSON)
-    side_effects = Column(JSON)
+    contraindications = Column(JSONType)
+    side_effects = Column(JSONType)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class Symptom(Base):
+    """
+    Symptom dictionary table (normalized symptom names)
+    """
+    __tablename__ = "symptoms"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False, index=True)
+
+
+# Junction between training samples and their symptoms; the composite key serves
+# per-sample lookups and the symptom_id index serves "samples with symptom X"
+training_symptoms = Table(
+    "training_symptoms",
+    Base.metadata,
+    Column("training_id", Integer, ForeignKey("training_data.id", ondelete="CASCADE"), primary_key=True),
+    Column("symptom_id", Integer, ForeignKey("symptoms.id"), primary_key=True, index=True)
+)
+
+
 class TrainingData(Base):
     """
     Training data samples for ML model training
@@ -116,24 +138,27 @@ class TrainingData(Base):
     
     # Patient demographics and vitals
     age = Column(Integer, nullable=False)
-    sex = Column(String, nullable=False)
+    sex = Column(SexType, nullable=False)
     vital_temperature_c = Column(Float, nullable=False)
     vital_heart_rate = Column(Integer, nullable=False)
     vital_blood_pressure_systolic = Column(Integer, nullable=True)
     vital_blood_pressure_diastolic = Column(Integer, nullable=True)
     
     # Clinical data
-    symptom_list = Column(JSON, nullable=False)  # List of symptoms
-    pmh_list = Column(JSON, default=lambda: [])  # Past medical history
-    current_medications = Column(JSON, default=lambda: [])  # Current medications
-    allergies = Column(JSON, default=lambda: [])  # Known allergies
+    symptom_list = Column(JSONType, nullable=False)  # List of symptoms
+    pmh_list = Column(JSONType, default=lambda: [])  # Past medical history
+    current_medications = Column(JSONType, default=lambda: [])  # Current medications
+    allergies = Column(JSONType, default=lambda: [])  # Known allergies
     chief_complaint = Column(Text, nullable=True)
     free_text_notes = Column(Text, nullable=True)
     
+    # Normalized copy of symptom_list, filled in automatically on insert
+    symptoms = relationship("Symptom", secondary=training_symptoms)
+    
     # Target labels (ground truth)
     target_disease = Column(Integer, nullable=False)  # ICD10 ID
-    target_tests = Column(JSON, nullable=False)  # List of medical test IDs
-    target_medications = Column(JSON, nullable=False)  # List of medication IDs
+    target_tests = Column(IntArrayType, nullable=False)  # List of medical test IDs
+    target_medications = Column(IntArrayType, nullable=False)  # List of medication IDs
     condition_name = Column(String, nullable=False, index=True)  # Human-readable condition
     
     # Metadata
@@ -148,6 +173,10 @@ class TrainingData(Base):
     
     # Indexes for efficient querying
     __table_args__ = (
+        gin_index("ix_training_symptoms_gin", "symptom_list"),
+        gin_index("ix_training_pmh_gin", "pmh_list"),
+        gin_index("ix_training_target_tests_gin", "target_tests"),
+        gin_index("ix_training_target_medications_gin", "target_medications"),
         {"sqlite_autoincrement": True}
     )
 
@@ -162,24 +191,24 @@ class ValidationData(Base):
     
     # Patient demographics and vitals
     age = Column(Integer, nullable=False)
-    sex = Column(String, nullable=False)
+    sex = Column(SexType, nullable=False)
     vital_temperature_c = Column(Float, nullable=False)
     vital_heart_rate = Column(Integer, nullable=False)
     vital_blood_pressure_systolic = Column(Integer, nullable=True)
     vital_blood_pressure_diastolic = Column(Integer, nullable=True)
     
     # Clinical data
-    symptom_list = Column(JSON, nullable=False)  # List of symptoms
-    pmh_list = Column(JSON, default=lambda: [])  # Past medical history
-    current_medications = Column(JSON, default=lambda: [])  # Current medications
-    allergies = Column(JSON, default=lambda: [])  # Known allergies
+    symptom_list = Column(JSONType, nullable=False)  # List of symptoms
+    pmh_list = Column(JSONType, default=lambda: [])  # Past medical history
+    current_medications = Column(JSONType, default=lambda: [])  # Current medications
+    allergies = Column(JSONType, default=lambda: [])  # Known allergies
     chief_complaint = Column(Text, nullable=True)
     free_text_notes = Column(Text, nullable=True)
     
     # Target labels (ground truth)
     target_disease = Column(Integer, nullable=False)  # ICD10 ID
-    target_tests = Column(JSON, nullable=False)  # List of medical test IDs
-    target_medications = Column(JSON, nullable=False)  # List of medication IDs
+    target_tests = Column(IntArrayType, nullable=False)  # List of medical test IDs
+    target_medications = Column(IntArrayType, nullable=False)  # List of medication IDs
     condition_name = Column(String, nullable=False, index=True)  # Human-readable condition
     
     # Metadata
@@ -194,5 +223,76 @@ class ValidationData(Base):
     
     # Indexes for efficient querying
     __table_args__ = (
+        gin_index("ix_validation_symptoms_gin", "symptom_list"),
+        gin_index("ix_validation_pmh_gin", "pmh_list"),
+        gin_index("ix_validation_target_tests_gin", "target_tests"),
+        gin_index("ix_validation_target_medications_gin", "target_medications"),
         {"sqlite_autoincrement": True}
-    )
\ No newline at end of file
+    )
+
+
+def normalize_symptom_names(symptom_list) -> list:
+    """
+    Distinct cleaned symptom names in first-seen order (non-strings and blanks skipped)
+    """
+    names = []
+    for symptom in symptom_list or []:
+        if isinstance(symptom, str):
+            name = symptom.lower().strip()
+            if name and name not in names:
+                names.append(name)
+    return names
+
+
+@event.listens_for(Session, "before_flush")
+def _link_training_symptoms(session, flush_context, instances):
+    """
+    Populate the training_symptoms junction for newly added training samples
+    """
+    new_samples = [obj for obj in session.new if isinstance(obj, TrainingData) and not obj.symptoms]
+    if not new_samples:
+        return
+    
+    names = {name for sample in new_samples for name in normalize_symptom_names(sample.symptom_list)}
+    if not names:
+        return
+    
+    # Resolve every symptom in the flush with one query, creating any that are new
+    with session.no_autoflush:
+        symptoms_by_name = {
+            symptom.name: symptom
+            for symptom in session.query(Symptom).filter(Symptom.name.in_(names))
+        }
+    for name in names - symptoms_by_name.keys():
+        symptoms_by_name[name] = Symptom(name=name)
+        session.add(symptoms_by_name[name])
+    
+    for sample in new_samples:
+        sample.symptoms = [symptoms_by_name[name] for name in normalize_symptom_names(sample.symptom_list)]
+
+
+def link_training_symptoms(session: Session, training_ids, symptom_lists) -> None:
+    """
+    Populate the training_symptoms junction for training rows inserted without the ORM
+    (Core executemany bypasses the before_flush hook above)
+    """
+    names_by_sample = {
+        training_id: normalize_symptom_names(symptom_list)
+        for training_id, symptom_list in zip(training_ids, symptom_lists)
+    }
+    names = {name for sample_names in names_by_sample.values() for name in sample_names}
+    if not names:
+        return
+    
+    # Resolve existing symptoms with one query, then insert and read back the new ones
+    symptom_ids = dict(session.execute(select(Symptom.name, Symptom.id).where(Symptom.name.in_(names))).all())
+    missing = names - symptom_ids.keys()
+    if missing:
+        session.execute(insert(Symptom), [{"name": name} for name in sorted(missing)])
+        symptom_ids.update(session.execute(select(Symptom.name, Symptom.id).where(Symptom.name.in_(missing))).all())
+    
+    session.execute(insert(training_symptoms), [
+        {"training_id": training_id, "symptom_id": symptom_ids[name]}
+        for training_id, sample_names in names_by_sample.items()
+        for name in sample_names
+    ])
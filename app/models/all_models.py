@@ -2,12 +2,40 @@
 Import all models to ensure they're registered with SQLAlchemy
 """
 
+from typing import List
+
+from sqlalchemy.orm import Session, relationship, selectinload
+
 # Import all models so they're available when the module is imported
 from app.models import *
+from app.models import Prediction, Symptom
 from app.models.feedback import ClinicalFeedback, ClinicalOutcomeRecord
 
+# Prediction -> feedback/outcome links, declared here once both sides are imported
+# (the feedback tables have no FK, so the join is spelled out and read-only)
+Prediction.feedback = relationship(
+    ClinicalFeedback,
+    primaryjoin="foreign(ClinicalFeedback.prediction_id) == Prediction.id",
+    viewonly=True
+)
+Prediction.outcomes = relationship(
+    ClinicalOutcomeRecord,
+    primaryjoin="foreign(ClinicalOutcomeRecord.prediction_id) == Prediction.id",
+    viewonly=True
+)
+
 # Make feedback models available in the main models namespace
 __all__ = [
-    'Patient', 'Prediction', 'ICD10Code', 'MedicalTest', 'Medication',
-    'TrainingData', 'ValidationData', 'ClinicalFeedback', 'ClinicalOutcomeRecord'
-]
\ No newline at end of file
+    'Patient', 'Prediction', 'ICD10Code', 'MedicalTest', 'Medication', 'Symptom',
+    'TrainingData', 'ValidationData', 'ClinicalFeedback', 'ClinicalOutcomeRecord',
+    'load_predictions_with_feedback'
+]
+
+
+def load_predictions_with_feedback(db: Session, prediction_ids: List[int]) -> List[Prediction]:
+    """
+    Load predictions with their feedback in two queries (one IN-list SELECT for all feedback)
+    """
+    return db.query(Prediction).options(
+        selectinload(Prediction.feedback)
+    ).filter(Prediction.id.in_(prediction_ids)).all()
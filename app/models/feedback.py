@@ -2,9 +2,9 @@
 Database models for clinical feedback system - Simplified version without foreign keys
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, JSONType, covering_index, gin_index
 
 
 class ClinicalFeedback(Base):
@@ -30,8 +30,8 @@ class ClinicalFeedback(Base):
     actual_condition_name = Column(String, nullable=True)
     
     # Clinical actions taken
-    ordered_tests = Column(JSON, nullable=False, default=lambda: [])
-    prescribed_medications = Column(JSON, nullable=False, default=lambda: [])
+    ordered_tests = Column(JSONType, nullable=False, default=lambda: [])
+    prescribed_medications = Column(JSONType, nullable=False, default=lambda: [])
     
     # Clinical notes
     clinical_notes = Column(Text, nullable=True)
@@ -41,6 +41,17 @@ class ClinicalFeedback(Base):
     feedback_timestamp = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Indexes for efficient querying
+    __table_args__ = (
+        gin_index("ix_feedback_ordered_tests_gin", "ordered_tests"),
+        gin_index("ix_feedback_prescribed_medications_gin", "prescribed_medications"),
+        # Feedback summary reads only these columns per prediction
+        covering_index(
+            "ix_cf_pred_cover", "prediction_id",
+            ["prediction_accurate", "actual_condition_name", "confidence_in_feedback"]
+        ),
+    )
 
 
 class ClinicalOutcomeRecord(Base):
@@ -59,14 +70,19 @@ class ClinicalOutcomeRecord(Base):
     treatment_effective = Column(Boolean, nullable=False)
     
     # Clinical details
-    side_effects = Column(JSON, nullable=True, default=lambda: [])
+    side_effects = Column(JSONType, nullable=True, default=lambda: [])
     diagnosis_confirmation_days = Column(Integer, nullable=True)
     treatment_duration_days = Column(Integer, nullable=True)
     readmission_required = Column(Boolean, nullable=True, default=False)
-    complications = Column(JSON, nullable=True, default=lambda: [])
+    complications = Column(JSONType, nullable=True, default=lambda: [])
     
     # Metadata
     reported_by = Column(String, nullable=False)
     outcome_date = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Indexes for efficient querying
+    __table_args__ = (
+        covering_index("ix_co_pred_cover", "prediction_id", ["treatment_effective", "final_condition_name"]),
+    )
\ No newline at end of file
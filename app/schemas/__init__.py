@@ -2,7 +2,7 @@
 Pydantic schemas for request/response validation
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -19,6 +19,9 @@ class PredictionRequest(BaseModel):
     """
     Request schema for disease prediction
     """
+    # Whitespace stripping happens in pydantic-core rather than in a Python validator
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     age: int = Field(..., ge=0, le=150, description="Patient age in years")
     sex: SexEnum = Field(..., description="Patient sex")
     
@@ -38,15 +41,18 @@ class PredictionRequest(BaseModel):
     chief_complaint: Optional[str] = Field(None, max_length=500, description="Chief complaint")
     free_text_notes: Optional[str] = Field(None, max_length=2000, description="Additional clinical notes")
     
-    @validator('symptom_list', 'pmh_list', 'current_medications', 'allergies')
+    @field_validator('symptom_list', 'pmh_list', 'current_medications', 'allergies')
+    @classmethod
     def validate_lists(cls, v):
-        return [item.strip().lower() for item in v if item.strip()]
+        return [item.lower() for item in v if item]
 
 
 class TestRecommendation(BaseModel):
     """
     Test recommendation schema
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     test: str = Field(..., description="Test name")
     test_code: Optional[str] = Field(None, description="Test code (CPT/LOINC)")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
@@ -58,6 +64,8 @@ class MedicationRecommendation(BaseModel):
     """
     Medication recommendation schema
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     medication: str = Field(..., description="Medication name")
     generic_name: Optional[str] = Field(None, description="Generic name")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
@@ -71,6 +79,8 @@ class DiseasePrediction(BaseModel):
     """
     Individual disease prediction schema
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     icd10_code: str = Field(..., description="ICD-10 diagnosis code")
     diagnosis: str = Field(..., description="Disease/condition name")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Prediction confidence")
@@ -90,7 +100,9 @@ class PredictionResponse(BaseModel):
     """
     Response schema for disease prediction
     """
-    predictions: List[DiseasePrediction] = Field(..., max_items=3, description="Top 3 predictions")
+    model_config = ConfigDict(protected_namespaces=())
+    
+    predictions: List[DiseasePrediction] = Field(..., max_length=3, description="Top 3 predictions")
     
     # Metadata
     model_version: str = Field(..., description="ML model version")
@@ -6,6 +6,8 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from app.schemas import SexEnum
+
 
 class DoctorFeedback(BaseModel):
     """
@@ -86,7 +88,7 @@ class TrainingDataRequest(BaseModel):
     """
     # Patient data
     age: int = Field(..., ge=0, le=120)
-    sex: str = Field(..., description="Patient sex (male/female/other)")
+    sex: SexEnum = Field(..., description="Patient sex (male/female/other)")
     
     # Vital signs
     vital_temperature_c: float = Field(..., ge=30.0, le=45.0)
@@ -95,7 +97,7 @@ class TrainingDataRequest(BaseModel):
     vital_blood_pressure_diastolic: Optional[int] = Field(None, ge=30, le=150)
     
     # Clinical presentation
-    symptom_list: List[str] = Field(..., min_items=1)
+    symptom_list: List[str] = Field(..., min_length=1)
     pmh_list: List[str] = Field(default_factory=list)
     current_medications: List[str] = Field(default_factory=list)
     allergies: List[str] = Field(default_factory=list)
@@ -2,26 +2,101 @@
 Utility functions for the Clinical Decision Support System
 """
 
+import atexit
 import hashlib
-import json
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, List
 from datetime import datetime
 import re
 
+from app.schemas import PredictionRequest
+
+# Patterns compiled once at import; used on every symptom and request field
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-\(\)]')
+_INJECTION_CHARS_RE = re.compile(r'[<>"\';]')
+
+# Common medical keywords to identify in free text
+_MEDICAL_TERMS = (
+    "pain", "ache", "burning", "sharp", "dull", "throbbing",
+    "nausea", "vomiting", "diarrhea", "constipation",
+    "fever", "chills", "sweats", "fatigue", "weakness",
+    "shortness", "breath", "cough", "wheeze", "congestion",
+    "headache", "dizziness", "confusion", "numbness",
+    "swelling", "rash", "itching", "bleeding", "discharge"
+)
+
+# (field, low, high, low warning, high warning) for single-value vital checks
+_VITAL_RULES = (
+    ("vital_temperature_c", 35.0, 40.0,
+     "Hypothermia detected (temperature < 35°C)", "High fever detected (temperature > 40°C)"),
+    ("vital_heart_rate", 50, 120,
+     "Bradycardia detected (heart rate < 50 bpm)", "Tachycardia detected (heart rate > 120 bpm)"),
+)
+
+
+# The QueueHandler installed on the root logger and the listener thread draining it;
+# the listener belongs to _log_listener_pid and is rebuilt in forked children
+_log_queue_handler = None
+_log_listener = None
+_log_listener_pid = None
+
+
+def _start_log_listener(handlers) -> None:
+    """
+    Point the QueueHandler at a fresh queue drained by a new listener thread in this process
+    """
+    global _log_listener, _log_listener_pid
+    log_queue = queue.SimpleQueue()
+    _log_queue_handler.queue = log_queue
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+
+
+def _restart_log_listener_after_fork() -> None:
+    # A forked child inherits the QueueHandler but not the listener thread
+    if _log_listener is not None:
+        _start_log_listener(_log_listener.handlers)
+
+
+def _stop_log_listener() -> None:
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        _log_listener.stop()
+
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """
-    Set up logging configuration
+    Set up logging configuration; handler I/O runs on a QueueListener thread
     """
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("app.log")
-        ]
-    )
+    global _log_queue_handler
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper()))
+    if _log_queue_handler is not None and _log_queue_handler in root.handlers:
+        # Already configured by an earlier call: don't stack another app.log handler
+        if _log_listener_pid != os.getpid():
+            _restart_log_listener_after_fork()
+        return logging.getLogger(__name__)
+    
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [logging.StreamHandler(), logging.FileHandler("app.log")]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; stream/file writes happen off the request path
+    first_setup = _log_queue_handler is None
+    _log_queue_handler = QueueHandler(queue.SimpleQueue())
+    if _log_listener is not None:
+        _stop_log_listener()
+    _start_log_listener(handlers)
+    if first_setup:
+        atexit.register(_stop_log_listener)
+        os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
+    
+    root.addHandler(_log_queue_handler)
     return logging.getLogger(__name__)
 
 
@@ -29,45 +104,43 @@ def generate_session_id(data: Dict[str, Any]) -> str:
     """
     Generate a unique session ID based on input data
     """
-    # Create a hash of relevant data (excluding timestamps)
-    relevant_data = {
-        "age": data.get("age"),
-        "sex": data.get("sex"),
-        "symptoms": sorted(data.get("symptom_list", [])),
-        "pmh": sorted(data.get("pmh_list", []))
-    }
-    
-    data_string = json.dumps(relevant_data, sort_keys=True)
-    return hashlib.md5(data_string.encode()).hexdigest()[:16]
+    # Hash relevant data (excluding timestamps) field by field, without building
+    # an intermediate string. ID only needs to be stable, not cryptographic:
+    # 8-byte BLAKE2b gives 16 hex chars
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(str(data.get("age")).encode())
+    hasher.update(b"|")
+    hasher.update(str(data.get("sex")).encode())
+    for symptom in sorted(data.get("symptom_list", [])):
+        hasher.update(b"|s:")
+        hasher.update(symptom.encode())
+    for condition in sorted(data.get("pmh_list", [])):
+        hasher.update(b"|p:")
+        hasher.update(condition.encode())
+    return hasher.hexdigest()
 
 
-def validate_vital_signs(data: Dict[str, Any]) -> List[str]:
+def validate_vital_signs(request: PredictionRequest) -> List[str]:
     """
-    Validate vital signs and return warnings for abnormal values
+    Validate vital signs of an already-parsed request and return warnings for abnormal values
     """
     warnings = []
     
-    # Temperature validation
-    temp = data.get("vital_temperature_c")
-    if temp:
-        if temp < 35.0:
-            warnings.append("Hypothermia detected (temperature < 35°C)")
-        elif temp > 40.0:
-            warnings.append("High fever detected (temperature > 40°C)")
-    
-    # Heart rate validation  
-    hr = data.get("vital_heart_rate")
-    if hr:
-        if hr < 50:
-            warnings.append("Bradycardia detected (heart rate < 50 bpm)")
-        elif hr > 120:
-            warnings.append("Tachycardia detected (heart rate > 120 bpm)")
+    # Temperature and heart rate validation
+    for field, low, high, low_warning, high_warning in _VITAL_RULES:
+        value = getattr(request, field)
+        if value is None:
+            continue
+        if value < low:
+            warnings.append(low_warning)
+        elif value > high:
+            warnings.append(high_warning)
     
     # Blood pressure validation
-    sys_bp = data.get("vital_blood_pressure_systolic")
-    dia_bp = data.get("vital_blood_pressure_diastolic")
+    sys_bp = request.vital_blood_pressure_systolic
+    dia_bp = request.vital_blood_pressure_diastolic
     
-    if sys_bp and dia_bp:
+    if sys_bp is not None and dia_bp is not None:
         if sys_bp > 180 or dia_bp > 110:
             warnings.append("Hypertensive crisis detected (BP > 180/110)")
         elif sys_bp < 90 or dia_bp < 60:
@@ -81,10 +154,10 @@ def clean_symptom_text(symptom: str) -> str:
     Clean and normalize symptom text
     """
     # Remove extra whitespace and convert to lowercase
-    cleaned = re.sub(r'\s+', ' ', symptom.strip().lower())
+    cleaned = _WHITESPACE_RE.sub(' ', symptom.strip().lower())
     
     # Remove special characters except hyphens and parentheses
-    cleaned = re.sub(r'[^\w\s\-\(\)]', '', cleaned)
+    cleaned = _SPECIAL_CHARS_RE.sub('', cleaned)
     
     return cleaned
 
@@ -135,7 +208,7 @@ def sanitize_input_data(data: Dict[str, Any]) -> Dict[str, Any]:
         if field in data and data[field] is not None:
             # Remove potentially dangerous characters
             text = str(data[field])
-            text = re.sub(r'[<>"\';]', '', text)  # Remove HTML/SQL injection chars
+            text = _INJECTION_CHARS_RE.sub('', text)  # Remove HTML/SQL injection chars
             text = text.strip()[:2000]  # Limit length
             if text:
                 sanitized[field] = text
@@ -148,7 +221,7 @@ def sanitize_input_data(data: Dict[str, Any]) -> Dict[str, Any]:
             sanitized_list = []
             for item in data[field]:
                 if isinstance(item, str):
-                    cleaned_item = re.sub(r'[<>"\';]', '', str(item))
+                    cleaned_item = _INJECTION_CHARS_RE.sub('', str(item))
                     cleaned_item = cleaned_item.strip()[:100]  # Limit item length
                     if cleaned_item:
                         sanitized_list.append(cleaned_item)
@@ -191,21 +264,6 @@ def extract_keywords_from_text(text: str) -> List[str]:
     if not text:
         return []
     
-    # Common medical keywords to identify
-    medical_terms = [
-        "pain", "ache", "burning", "sharp", "dull", "throbbing",
-        "nausea", "vomiting", "diarrhea", "constipation",
-        "fever", "chills", "sweats", "fatigue", "weakness",
-        "shortness", "breath", "cough", "wheeze", "congestion",
-        "headache", "dizziness", "confusion", "numbness",
-        "swelling", "rash", "itching", "bleeding", "discharge"
-    ]
-    
+    # Terms are unique, so keeping those found avoids a separate de-duplication pass
     text_lower = text.lower()
-    found_keywords = []
-    
-    for term in medical_terms:
-        if term in text_lower:
-            found_keywords.append(term)
-    
-    return list(set(found_keywords))  # Remove duplicates
\ No newline at end of file
+    return [term for term in _MEDICAL_TERMS if term in text_lower]
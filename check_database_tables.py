@@ -3,35 +3,36 @@
 Script to check database table population
 """
 from app.database import engine
-from sqlalchemy import text
+from sqlalchemy import inspect, text
+
+# (table, label) in display order
+_COUNTED_TABLES = (
+    ("icd10_codes", "ICD-10 codes"),
+    ("medical_tests", "Medical tests"),
+    ("medications", "Medications"),
+    ("predictions", "Predictions"),
+)
 
 def check_table_counts():
     """Check how many records are in each reference table"""
     with engine.connect() as conn:
-        # Check ICD10 codes
-        icd10_result = conn.execute(text('SELECT COUNT(*) FROM icd10_codes'))
-        icd10_count = icd10_result.scalar()
-        
-        # Check medical tests
-        tests_result = conn.execute(text('SELECT COUNT(*) FROM medical_tests'))
-        tests_count = tests_result.scalar()
-        
-        # Check medications
-        meds_result = conn.execute(text('SELECT COUNT(*) FROM medications'))
-        meds_count = meds_result.scalar()
+        # One catalog lookup finds missing tables, so a fresh database doesn't fail the count
+        existing = set(inspect(conn).get_table_names())
+        present = [table for table, _ in _COUNTED_TABLES if table in existing]
         
-        # Check predictions 
-        pred_result = conn.execute(text('SELECT COUNT(*) FROM predictions'))
-        pred_count = pred_result.scalar()
+        # Count all present tables in a single round-trip
+        counts = {}
+        if present:
+            subqueries = ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in present)
+            counts = dict(zip(present, conn.execute(text(f"SELECT {subqueries}")).one()))
         
         print("=== DATABASE TABLE COUNTS ===")
-        print(f"ICD-10 codes: {icd10_count}")
-        print(f"Medical tests: {tests_count}")
-        print(f"Medications: {meds_count}")
-        print(f"Predictions: {pred_count}")
+        for table, label in _COUNTED_TABLES:
+            print(f"{label}: {counts[table] if table in counts else 'missing'}")
         
-        if icd10_count == 0 and tests_count == 0 and meds_count == 0:
-            print("\n❌ ISSUE: All reference tables are empty!")
+        reference_counts = [counts.get(table, 0) for table, _ in _COUNTED_TABLES[:3]]
+        if not any(reference_counts):
+            print("\n❌ ISSUE: All reference tables are empty or missing!")
         else:
             print("\n✅ Some reference data exists")
 
@@ -1,20 +1,26 @@
 """
 Simple ICD-10 table checker
 """
-import sqlite3
+from app.database import connect_sqlite
 
 def check_icd10_table():
     try:
-        conn = sqlite3.connect('pdpcds_dev.db')
+        conn = connect_sqlite('pdpcds_dev.db')
         cursor = conn.cursor()
         
+        # Count all three reference tables in one statement
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM icd10_codes),
+                   (SELECT COUNT(*) FROM medical_tests),
+                   (SELECT COUNT(*) FROM medications)
+        """)
+        count, test_count, med_count = cursor.fetchone()
+        
         # Check ICD-10 codes table
-        cursor.execute("SELECT COUNT(*) FROM icd10_codes")
-        count = cursor.fetchone()[0]
         print(f"📊 ICD-10 codes in database: {count}")
         
         if count > 0:
-            cursor.execute("SELECT * FROM icd10_codes LIMIT 10")
+            cursor.execute("SELECT id, code, description FROM icd10_codes LIMIT 10")
             rows = cursor.fetchall()
             print("\n📋 Sample ICD-10 codes:")
             for row in rows:
@@ -23,13 +29,9 @@ def check_icd10_table():
             print("❌ No ICD-10 codes found in database")
             
         # Check medical tests table
-        cursor.execute("SELECT COUNT(*) FROM medical_tests")
-        test_count = cursor.fetchone()[0]
         print(f"\n🧪 Medical tests in database: {test_count}")
         
         # Check medications table  
-        cursor.execute("SELECT COUNT(*) FROM medications")
-        med_count = cursor.fetchone()[0]
         print(f"💊 Medications in database: {med_count}")
         
         conn.close()
@@ -7,15 +7,18 @@ import sys
 import os
 sys.path.append('.')
 
-from sqlalchemy import create_engine, text, Column, Integer, String, Float, DateTime, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, Boolean, JSON, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import CreateTable
+from app.database import apply_sqlite_pragmas
 from sqlalchemy.ext.declarative import declarative_base
 
 # Create base and engine
 Base = declarative_base()
 DATABASE_URL = "sqlite:///./pdpcds_dev.db"
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+event.listen(engine, "connect", apply_sqlite_pragmas)
 
 def get_engine():
     """Return the SQLAlchemy engine used by this script."""
@@ -110,25 +113,11 @@ def create_feedback_tables_manually():
     
     engine = get_engine()
     
-    # Check if tables exist
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-        existing_tables = [row[0] for row in result]
-        print(f"Existing tables: {existing_tables}")
-        
-        if 'clinical_feedback' not in existing_tables:
-            print("Creating clinical_feedback table...")
-            ClinicalFeedback.__table__.create(engine)
-            print("✅ clinical_feedback table created")
-        else:
-            print("✅ clinical_feedback table already exists")
-            
-        if 'clinical_outcomes' not in existing_tables:
-            print("Creating clinical_outcomes table...")
-            ClinicalOutcomeRecord.__table__.create(engine)
-            print("✅ clinical_outcomes table created")
-        else:
-            print("✅ clinical_outcomes table already exists")
+    # Idempotent CREATE TABLE IF NOT EXISTS in one transaction; no sqlite_master scan first
+    with engine.begin() as conn:
+        for table in (ClinicalFeedback.__table__, ClinicalOutcomeRecord.__table__):
+            conn.execute(CreateTable(table, if_not_exists=True))
+            print(f"✅ {table.name} table ready")
 
 if __name__ == "__main__":
     try:
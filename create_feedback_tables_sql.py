@@ -3,9 +3,10 @@
 Create feedback tables directly using SQL
 """
 
-import sqlite3
 import os
 
+from app.database import connect_sqlite
+
 def create_feedback_tables():
     """Create clinical feedback and outcome tables"""
     
@@ -14,13 +15,15 @@ def create_feedback_tables():
         print(f"❌ Database file not found: {db_path}")
         return
     
-    conn = sqlite3.connect(db_path)
+    conn = connect_sqlite(db_path)
+    conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache for this setup connection
     cursor = conn.cursor()
     
     try:
-        # Create clinical_feedback table
-        print("Creating clinical_feedback table...")
-        cursor.execute("""
+        # Both tables and their indexes in one script and one transaction (single commit)
+        print("Creating clinical_feedback and clinical_outcomes tables...")
+        cursor.executescript("""
+            BEGIN IMMEDIATE;
             CREATE TABLE IF NOT EXISTS clinical_feedback (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 prediction_id INTEGER NOT NULL,
@@ -39,18 +42,9 @@ def create_feedback_tables():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (prediction_id) REFERENCES predictions (id)
-            )
-        """)
-        
-        # Create indexes for clinical_feedback
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_clinical_feedback_prediction_id ON clinical_feedback (prediction_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_clinical_feedback_doctor_id ON clinical_feedback (doctor_id)")
-        
-        print("✅ clinical_feedback table created")
-        
-        # Create clinical_outcomes table
-        print("Creating clinical_outcomes table...")
-        cursor.execute("""
+            );
+            CREATE INDEX IF NOT EXISTS idx_clinical_feedback_prediction_id ON clinical_feedback (prediction_id);
+            CREATE INDEX IF NOT EXISTS idx_clinical_feedback_doctor_id ON clinical_feedback (doctor_id);
             CREATE TABLE IF NOT EXISTS clinical_outcomes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 prediction_id INTEGER NOT NULL,
@@ -68,18 +62,15 @@ def create_feedback_tables():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (prediction_id) REFERENCES predictions (id)
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_clinical_outcomes_prediction_id ON clinical_outcomes (prediction_id);
+            CREATE INDEX IF NOT EXISTS idx_clinical_outcomes_outcome_date ON clinical_outcomes (outcome_date);
+            COMMIT;
         """)
         
-        # Create indexes for clinical_outcomes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_clinical_outcomes_prediction_id ON clinical_outcomes (prediction_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_clinical_outcomes_outcome_date ON clinical_outcomes (outcome_date)")
-        
+        print("✅ clinical_feedback table created")
         print("✅ clinical_outcomes table created")
         
-        # Commit changes
-        conn.commit()
-        
         # Verify tables were created
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
         tables = cursor.fetchall()
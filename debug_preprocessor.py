@@ -4,6 +4,7 @@ Debug script to check preprocessor dimensions
 """
 import json
 import pickle
+import time
 from app.ml.preprocessor import DataPreprocessor
 
 # Load test data
@@ -35,4 +36,23 @@ try:
 except Exception as e:
     print(f"   Error: {e}")
 
+# Compare per-sample and batched preprocessing cost
+print("\n3. Batch Preprocessing:")
+batch_size = 1024
+try:
+    start = time.perf_counter_ns()
+    for _ in range(batch_size):
+        default_preprocessor.preprocess_input(test_data)
+    single_ns = time.perf_counter_ns() - start
+    
+    start = time.perf_counter_ns()
+    result = default_preprocessor.preprocess_batch([test_data] * batch_size)
+    batch_ns = time.perf_counter_ns() - start
+    
+    print(f"   Output shape: {result.shape}")
+    print(f"   One at a time: {single_ns / batch_size / 1000:.2f} µs/sample")
+    print(f"   Batched: {batch_ns / batch_size / 1000:.2f} µs/sample")
+except Exception as e:
+    print(f"   Error: {e}")
+
 print("\n✅ Dimension analysis complete!")
\ No newline at end of file
@@ -4,14 +4,28 @@ Run this script to explore the database content interactively
 """
 
 import sqlite3
-import pandas as pd
 from datetime import datetime
-import json
+import orjson
+
+from app.database import connect_sqlite
+
+# Declared column types left out of sample data unless asked for
+_LARGE_COLUMN_TYPES = ("TEXT", "BLOB")
+
+# Constant SQL text so sqlite3's per-connection statement cache reuses the prepared statements
+_TABLE_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?;"
+_TABLE_INFO_SQL = "SELECT cid, name, type, \"notnull\", dflt_value, pk FROM pragma_table_info(?);"
+_ALL_TABLE_INFO_SQL = """
+    SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p
+    WHERE m.type = 'table'
+    ORDER BY m.rowid, p.cid;
+"""
 
 def connect_to_database():
     """Connect to the SQLite database"""
     try:
-        conn = sqlite3.connect('pdpcds_dev.db')
+        conn = connect_sqlite('pdpcds_dev.db')
         conn.row_factory = sqlite3.Row  # This allows column access by name
         return conn
     except sqlite3.Error as e:
@@ -30,11 +44,17 @@ def show_tables(conn):
         print(f"  • {table[0]}")
     return [table[0] for table in tables]
 
-def show_table_schema(conn, table_name):
-    """Display the schema of a specific table"""
-    cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table_name});")
-    columns = cursor.fetchall()
+def load_table_schemas(conn):
+    """Column info for every table, keyed by table name, from a single query"""
+    schemas = {}
+    for row in conn.execute(_ALL_TABLE_INFO_SQL):
+        schemas.setdefault(row[0], []).append(tuple(row)[1:])
+    return schemas
+
+def show_table_schema(conn, table_name, columns=None):
+    """Display the schema of a specific table (columns as returned by load_table_schemas)"""
+    if columns is None:
+        columns = conn.execute(_TABLE_INFO_SQL, (table_name,)).fetchall()
     
     print(f"\n🏗️  Schema for table '{table_name}':")
     print("=" * 60)
@@ -47,33 +67,71 @@ def show_table_schema(conn, table_name):
         pk = "PK" if col[5] else ""
         print(f"{col[1]:<20} {col[2]:<15} {not_null:<8} {str(default):<15} {pk:<4}")
 
-def show_table_data(conn, table_name, limit=10):
-    """Display sample data from a table"""
+def show_table_data(conn, table_name, limit=10, include_text=False):
+    """Display sample data from a table (free-text TEXT/BLOB columns only if include_text)"""
     cursor = conn.cursor()
-    cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
+    table = _quoted_table(cursor, table_name)
+    cursor.execute(f"SELECT COUNT(*) FROM {table};")
     total_rows = cursor.fetchone()[0]
     
-    cursor.execute(f"SELECT * FROM {table_name} LIMIT {limit};")
-    rows = cursor.fetchall()
+    # Select named columns rather than *, leaving out bulky free-text columns by default
+    selected, skipped = [], []
+    for col in cursor.execute(_TABLE_INFO_SQL, (table_name,)).fetchall():
+        large = col[2].upper() in _LARGE_COLUMN_TYPES
+        (skipped if large and not include_text else selected).append(col[1])
+    if not selected:
+        # Nothing but free-text columns; show them rather than select no columns
+        selected, skipped = skipped, []
+    column_list = ", ".join(f'"{name}"' for name in selected)
+    
+    cursor.execute(f"SELECT {column_list} FROM {table} LIMIT ?;", (limit,))
+    cursor.arraysize = limit
+    rows = cursor.fetchmany()
     
     print(f"\n📊 Data from table '{table_name}' (showing {len(rows)} of {total_rows} rows):")
     print("=" * 80)
+    if skipped:
+        print(f"  (free-text columns not shown: {', '.join(skipped)})")
     
     if rows:
-        # Convert to pandas DataFrame for better display
-        df = pd.DataFrame([dict(row) for row in rows])
+        columns = [description[0] for description in cursor.description]
         
-        # Handle JSON columns for better display
-        for col in df.columns:
-            if any(isinstance(val, str) and val.startswith(('[', '{')) for val in df[col] if pd.notna(val)):
-                df[col] = df[col].apply(lambda x: json.loads(x) if pd.notna(x) and isinstance(x, str) else x)
+        # Decide once per column, from its first non-null value, whether it holds JSON
+        json_columns = set()
+        for index, column in enumerate(columns):
+            first_value = next((row[index] for row in rows if row[index] is not None), None)
+            if isinstance(first_value, str) and first_value.startswith(('[', '{')):
+                json_columns.add(index)
         
-        print(df.to_string(max_rows=limit, max_cols=10, width=100))
+        for row_number, row in enumerate(rows, 1):
+            print(f"  [{row_number}]")
+            for index, column in enumerate(columns):
+                value = row[index]
+                if index in json_columns and isinstance(value, str):
+                    try:
+                        value = orjson.loads(value)
+                    except ValueError:
+                        pass
+                print(f"    {column:<30} {_truncate(value)}")
     else:
         print("  No data found in this table.")
 
+def _quoted_table(cursor, table_name):
+    """Quoted identifier for table_name, which must be an existing table"""
+    # Identifiers can't be bound as parameters, so check the name against sqlite_master first
+    if cursor.execute(_TABLE_EXISTS_SQL, (table_name,)).fetchone() is None:
+        raise ValueError(f"Unknown table: {table_name!r}")
+    return '"' + table_name.replace('"', '""') + '"'
+
+def _truncate(value, width=70):
+    """Single-line display form of a value, cut to width characters"""
+    text = str(value)
+    return text if len(text) <= width else text[:width - 3] + "..."
+
 def interactive_query(conn):
     """Allow user to run custom SQL queries"""
+    import pandas as pd  # Only needed for result tables, so loaded on entering query mode
+    
     print(f"\n💻 Interactive SQL Query Mode")
     print("=" * 50)
     print("Enter your SQL queries (type 'exit' to quit):")
@@ -93,12 +151,15 @@ def interactive_query(conn):
             cursor.execute(query)
             
             if query.upper().startswith('SELECT'):
-                rows = cursor.fetchall()
+                # Only the first page is held in memory; the rest is counted as it streams past
+                rows = cursor.fetchmany(50)
                 if rows:
-                    df = pd.DataFrame([dict(row) for row in rows])
-                    print(f"\n📊 Query Results ({len(rows)} rows):")
+                    total_rows = len(rows) + sum(1 for _ in cursor)
+                    columns = [description[0] for description in cursor.description]
+                    df = pd.DataFrame.from_records(rows, columns=columns)
+                    print(f"\n📊 Query Results ({total_rows} rows, showing first {len(rows)}):")
                     print("-" * 50)
-                    print(df.to_string(max_rows=50, width=120))
+                    print(df.to_string(line_width=120))
                 else:
                     print("No results found.")
             else:
@@ -129,8 +190,9 @@ def main():
             return
         
         # Show schema and data for each table
+        schemas = load_table_schemas(conn)
         for table in tables:
-            show_table_schema(conn, table)
+            show_table_schema(conn, table, schemas.get(table))
             show_table_data(conn, table, limit=5)
             print("\n" + "=" * 80)
         
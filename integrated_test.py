@@ -1,28 +1,49 @@
 """
-Standalone test that starts server and tests API in the same process
+Standalone test that starts the server in a subprocess and tests the API against it
 """
-import threading
+import subprocess
 import time
+import orjson
 import requests
-import uvicorn
-from fastapi import FastAPI
+from requests.adapters import HTTPAdapter
 import sys
 import os
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
-def run_server():
-    """Run the server in a separate thread"""
-    from app.main import app
-    uvicorn.run(app, host="127.0.0.1", port=8001, log_level="info")
+BASE_URL = "http://127.0.0.1:8001"
+
+# One keep-alive session so the readiness probe and API calls share pooled connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+def start_server():
+    """Start the server in its own process (no GIL shared with the test client)"""
+    return subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", "8001", "--log-level", "info",
+    ])
+
+def wait_for_server(timeout=30):
+    """Poll /health until the server answers or timeout seconds pass"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            SESSION.get(f"{BASE_URL}/health", timeout=0.2)
+            return True
+        except requests.exceptions.RequestException:
+            time.sleep(0.05)
+    return False
 
 def test_api():
     """Test the API once server is running"""
     print("🧪 Testing API with integrated server...")
     
     # Wait for server to start
-    time.sleep(3)
+    if not wait_for_server():
+        print("❌ Server did not start in time")
+        return False
     
     test_data = {
         "age": 35,
@@ -37,9 +58,10 @@ def test_api():
     }
     
     try:
-        response = requests.post(
-            "http://127.0.0.1:8001/api/v1/predict/",
-            json=test_data,
+        response = SESSION.post(
+            f"{BASE_URL}/api/v1/predict/",
+            data=orjson.dumps(test_data),
+            headers={"Content-Type": "application/json"},
             timeout=10
         )
         
@@ -63,9 +85,9 @@ def check_database():
     """Check database for inserted records"""
     print("\n🔍 Checking database for inserted records...")
     
-    import sqlite3
+    from app.database import connect_sqlite
     try:
-        conn = sqlite3.connect('pdpcds_dev.db')
+        conn = connect_sqlite('pdpcds_dev.db')
         cursor = conn.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM predictions")
@@ -73,11 +95,11 @@ def check_database():
         print(f"📊 Total predictions in database: {count}")
         
         if count > 0:
+            # The autoincrement id tracks insertion order; MAX(id) is one primary-key lookup, no sort
             cursor.execute("""
                 SELECT patient_id, age, sex, vital_temperature_c, created_at 
                 FROM predictions 
-                ORDER BY created_at DESC 
-                LIMIT 1
+                WHERE id = (SELECT MAX(id) FROM predictions)
             """)
             
             record = cursor.fetchone()
@@ -100,23 +122,23 @@ if __name__ == "__main__":
     print("🏥 Clinical Decision Support System - Integrated Test")
     print("=" * 60)
     
-    # Start server in background thread
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
+    # Start server in a separate process
+    server_process = start_server()
     
-    # Test API
-    api_success = test_api()
-    
-    # Check database
-    if api_success:
-        db_success = check_database()
+    try:
+        # Test API
+        api_success = test_api()
         
-        if db_success:
-            print("\n🎉 SUCCESS: API works and database insertion is working!")
+        # Check database
+        if api_success:
+            db_success = check_database()
+            
+            if db_success:
+                print("\n🎉 SUCCESS: API works and database insertion is working!")
+            else:
+                print("\n⚠️ API works but database insertion failed!")
         else:
-            print("\n⚠️ API works but database insertion failed!")
-    else:
-        print("\n❌ API test failed!")
-    
-    # Allow some time to see results before exit
-    time.sleep(2)
\ No newline at end of file
+            print("\n❌ API test failed!")
+    finally:
+        server_process.terminate()
+        server_process.wait(timeout=10)
\ No newline at end of file
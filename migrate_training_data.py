@@ -4,13 +4,19 @@ Migrate training data from CSV files to database tables
 This script transfers train_dataset.csv and val_dataset.csv to TrainingData and ValidationData tables
 """
 
+import numpy as np
 import pandas as pd
 import json
 import ast
-from sqlalchemy import create_engine
+import csv
+from contextlib import contextmanager
+from functools import lru_cache
+import orjson
+from sqlalchemy import create_engine, delete, event, func, insert, inspect
 from sqlalchemy.orm import sessionmaker
-from app.models import TrainingData, ValidationData
-from app.database import Base
+from sqlalchemy.pool import StaticPool
+from app.models import TrainingData, ValidationData, link_training_symptoms, training_symptoms
+from app.database import Base, JSON_CODEC_OPTIONS, apply_sqlite_pragmas
 import logging
 from pathlib import Path
 
@@ -20,9 +26,42 @@ logger = logging.getLogger(__name__)
 
 # Database configuration
 DATABASE_URL = "sqlite:///./pdpcds_dev.db"
-engine = create_engine(DATABASE_URL)
+# One long-lived connection for the whole run, so the pragmas below are applied once
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+    insertmanyvalues_page_size=10_000,
+    **JSON_CODEC_OPTIONS  # orjson for the six JSON list columns of every row
+)
+
+# Bulk-load tuning on top of the shared pragmas: the data is reloadable from the CSVs,
+# so commits skip fsync and the page cache is sized for the whole load
+_BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-200000",
+)
+
+@event.listens_for(engine, "connect")
+def _tune_sqlite_for_bulk_load(dbapi_connection, connection_record):
+    apply_sqlite_pragmas(dbapi_connection)
+    cursor = dbapi_connection.cursor()
+    for pragma in _BULK_LOAD_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+@lru_cache(maxsize=4096)
+def _parse_list_literal(text):
+    """Parse a list literal, with orjson when it is JSON-compatible (cached per distinct string)"""
+    # Without double quotes or escapes, single quotes can only be string delimiters
+    if '"' not in text and '\\' not in text:
+        try:
+            return tuple(orjson.loads(text.replace("'", '"')))
+        except orjson.JSONDecodeError:
+            pass
+    return tuple(ast.literal_eval(text))
+
 def safe_eval_list(value):
     """Safely convert string representation of list to actual list"""
     if pd.isna(value) or value == '' or value == '[]':
@@ -34,29 +73,146 @@ def safe_eval_list(value):
             # Remove extra quotes and clean up
             cleaned_value = value.strip()
             if cleaned_value.startswith('[') and cleaned_value.endswith(']'):
-                return ast.literal_eval(cleaned_value)
+                return list(_parse_list_literal(cleaned_value))
             elif cleaned_value.startswith("'[") and cleaned_value.endswith("]'"):
-                return ast.literal_eval(cleaned_value[1:-1])
+                return list(_parse_list_literal(cleaned_value[1:-1]))
         
         return value if isinstance(value, list) else []
     except (ValueError, SyntaxError) as e:
         logger.warning(f"Could not parse list value '{value}': {e}")
         return []
 
-def migrate_csv_to_database():
-    """Migrate CSV training data to database tables"""
+# CSV columns by how they are coerced before insert
+_INT_COLUMNS = ['age', 'vital_heart_rate', 'target_disease']
+_FLOAT_COLUMNS = ['vital_temperature_c']
+_NULLABLE_INT_COLUMNS = ['vital_blood_pressure_systolic', 'vital_blood_pressure_diastolic']
+_LIST_COLUMNS = ['symptom_list', 'pmh_list', 'current_medications', 'allergies', 'target_tests', 'target_medications']
+_NULLABLE_TEXT_COLUMNS = ['chief_complaint', 'free_text_notes']
+_TEXT_COLUMNS = ['sex', 'condition_name']
+
+# Rows per INSERT batch; each batch is committed on its own to cap transaction size
+BATCH_SIZE = 10_000
+
+# (label, CSV path, model, fill training_symptoms) for each migrated dataset
+DATASETS = (
+    ("training", Path("training/data/train_dataset.csv"), TrainingData, True),
+    ("validation", Path("training/data/val_dataset.csv"), ValidationData, False),
+)
+
+# Provenance stamped on every migrated record
+_MIGRATION_METADATA = {
+    'data_source': "csv_migration",
+    'quality_score': 1.0,
+    'is_validated': True,
+    'created_by': "migration_script",
+}
+
+def read_dataset_csv(path):
+    """Stream a dataset CSV in BATCH_SIZE-row chunks, parsing list columns while reading and typing the rest"""
+    return pd.read_csv(
+        path,
+        chunksize=BATCH_SIZE,
+        dtype={column: 'category' for column in _TEXT_COLUMNS},
+        converters={column: safe_eval_list for column in _LIST_COLUMNS}
+    )
+
+def dataframe_to_records(df, label):
+    """Coerce CSV columns in bulk and return insertable row dicts (rows with unusable numbers are skipped)"""
+    required = df[_INT_COLUMNS + _FLOAT_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    nullable = df[_NULLABLE_INT_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    # Nullable columns may be blank, but a present value that isn't a number is unusable
+    invalid = required.isna().any(axis=1) | (nullable.isna() & df[_NULLABLE_INT_COLUMNS].notna()).any(axis=1)
+    if invalid.any():
+        # Lazy %-formatting; the per-row dicts are only built when ERROR is actually emitted
+        if logger.isEnabledFor(logging.ERROR):
+            for index, row in df[invalid].to_dict(orient='index').items():
+                logger.error("Error processing %s row %s: missing or non-numeric value", label, index)
+                logger.error("Row data: %s", row)
+        df, required, nullable = df[~invalid], required[~invalid], nullable[~invalid]
     
-    # File paths
-    train_csv_path = Path("training/data/train_dataset.csv")
-    val_csv_path = Path("training/data/val_dataset.csv")
+    # Integer columns truncate like int()
+    columns = {column: required[column].astype(int) for column in _INT_COLUMNS}
+    columns.update({column: required[column].astype(float) for column in _FLOAT_COLUMNS})
+    for column in _NULLABLE_INT_COLUMNS:
+        values = np.trunc(nullable[column]).astype('Int32')
+        columns[column] = values.astype(object).where(values.notna(), None)
+    for column in _NULLABLE_TEXT_COLUMNS:
+        # object dtype so missing values become None rather than pd.NA / NaN
+        columns[column] = df[column].astype(object).where(df[column].notna(), None)
+    for column in _TEXT_COLUMNS:
+        columns[column] = df[column]
+    for column in _LIST_COLUMNS:
+        # Already parsed by read_dataset_csv's converters
+        columns[column] = df[column]
     
-    if not train_csv_path.exists():
-        logger.error(f"Training CSV file not found: {train_csv_path}")
-        return False
+    # Zip whole-column lists (tolist() yields native Python values) into row dicts;
+    # several times cheaper than DataFrame.to_dict('records')
+    keys = list(columns) + list(_MIGRATION_METADATA)
+    metadata = tuple(_MIGRATION_METADATA.values())
+    return [
+        dict(zip(keys, values + metadata))
+        for values in zip(*(series.tolist() for series in columns.values()))
+    ]
+
+def insert_in_batches(db, model, records, link_symptoms=False):
+    """Insert records into model's table BATCH_SIZE rows at a time, committing each batch"""
+    # Built once against the Table rather than the mapped class, so batches skip the ORM
+    # bulk-insert layer and go straight to Core executemany (compiled once, then cached)
+    table = model.__table__
+    statement = insert(table)
+    if link_symptoms:
+        # RETURNING gives the new ids for the symptom junction
+        statement = statement.returning(table.c.id, sort_by_parameter_order=True)
     
-    if not val_csv_path.exists():
-        logger.error(f"Validation CSV file not found: {val_csv_path}")
-        return False
+    for start in range(0, len(records), BATCH_SIZE):
+        batch = records[start:start + BATCH_SIZE]
+        if link_symptoms:
+            ids = db.execute(statement, batch).scalars().all()
+            link_training_symptoms(db, ids, (record['symptom_list'] for record in batch))
+        else:
+            db.execute(statement, batch)
+        db.commit()
+
+def migrate_csv_file(db, path, model, label, link_symptoms=False):
+    """Stream one CSV into model's table a chunk at a time; returns (rows read, rows inserted)"""
+    rows_read = rows_inserted = 0
+    with read_dataset_csv(path) as chunks:
+        for chunk in chunks:
+            records = dataframe_to_records(chunk, label)
+            insert_in_batches(db, model, records, link_symptoms)
+            rows_read += len(chunk)
+            rows_inserted += len(records)
+    return rows_read, rows_inserted
+
+@contextmanager
+def secondary_indexes_dropped(db, tables):
+    """Drop the tables' non-unique indexes for the duration of a bulk load, then rebuild them"""
+    inspector = inspect(db.connection())
+    dropped = []
+    for table in tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        dropped.extend(index for index in table.indexes if not index.unique and index.name in existing)
+    
+    for index in dropped:
+        index.drop(db.connection())
+    db.commit()
+    try:
+        yield
+    finally:
+        # A failed load leaves the session needing a rollback before the rebuild
+        db.rollback()
+        logger.info(f"Rebuilding {len(dropped)} indexes...")
+        for index in dropped:
+            index.create(db.connection())
+        db.commit()
+
+def migrate_csv_to_database():
+    """Migrate CSV training data to database tables; returns CSV row counts by dataset label, or None on failure"""
+    
+    for label, csv_path, _, _ in DATASETS:
+        if not csv_path.exists():
+            logger.error(f"{label.capitalize()} CSV file not found: {csv_path}")
+            return None
     
     try:
         # Create database session
@@ -64,91 +220,23 @@ def migrate_csv_to_database():
         
         # Clear existing data
         logger.info("Clearing existing training and validation data...")
-        db.query(TrainingData).delete()
-        db.query(ValidationData).delete()
-        db.commit()
-        
-        # Load and migrate training data
-        logger.info(f"Loading training data from {train_csv_path}")
-        train_df = pd.read_csv(train_csv_path)
-        logger.info(f"Found {len(train_df)} training samples")
-        
-        training_records = []
-        for _, row in train_df.iterrows():
-            try:
-                record = TrainingData(
-                    age=int(row['age']),
-                    sex=row['sex'],
-                    vital_temperature_c=float(row['vital_temperature_c']),
-                    vital_heart_rate=int(row['vital_heart_rate']),
-                    vital_blood_pressure_systolic=int(row['vital_blood_pressure_systolic']) if pd.notna(row['vital_blood_pressure_systolic']) else None,
-                    vital_blood_pressure_diastolic=int(row['vital_blood_pressure_diastolic']) if pd.notna(row['vital_blood_pressure_diastolic']) else None,
-                    symptom_list=safe_eval_list(row['symptom_list']),
-                    pmh_list=safe_eval_list(row['pmh_list']),
-                    current_medications=safe_eval_list(row['current_medications']),
-                    allergies=safe_eval_list(row['allergies']),
-                    chief_complaint=row['chief_complaint'] if pd.notna(row['chief_complaint']) else None,
-                    free_text_notes=row['free_text_notes'] if pd.notna(row['free_text_notes']) else None,
-                    target_disease=int(row['target_disease']),
-                    target_tests=safe_eval_list(row['target_tests']),
-                    target_medications=safe_eval_list(row['target_medications']),
-                    condition_name=row['condition_name'],
-                    data_source="csv_migration",
-                    quality_score=1.0,
-                    is_validated=True,
-                    created_by="migration_script"
-                )
-                training_records.append(record)
-            except Exception as e:
-                logger.error(f"Error processing training row {len(training_records)}: {e}")
-                logger.error(f"Row data: {row.to_dict()}")
-                continue
-        
-        # Bulk insert training data
-        logger.info(f"Inserting {len(training_records)} training records...")
-        db.add_all(training_records)
+        # Plain bulk DELETEs with no session sync; SQLite doesn't enforce the junction's
+        # ON DELETE CASCADE by default, so its rows are cleared explicitly
+        db.execute(delete(training_symptoms))
+        for _, _, model, _ in DATASETS:
+            db.execute(delete(model).execution_options(synchronize_session=False))
         db.commit()
         
-        # Load and migrate validation data
-        logger.info(f"Loading validation data from {val_csv_path}")
-        val_df = pd.read_csv(val_csv_path)
-        logger.info(f"Found {len(val_df)} validation samples")
+        csv_counts = {}
         
-        validation_records = []
-        for _, row in val_df.iterrows():
-            try:
-                record = ValidationData(
-                    age=int(row['age']),
-                    sex=row['sex'],
-                    vital_temperature_c=float(row['vital_temperature_c']),
-                    vital_heart_rate=int(row['vital_heart_rate']),
-                    vital_blood_pressure_systolic=int(row['vital_blood_pressure_systolic']) if pd.notna(row['vital_blood_pressure_systolic']) else None,
-                    vital_blood_pressure_diastolic=int(row['vital_blood_pressure_diastolic']) if pd.notna(row['vital_blood_pressure_diastolic']) else None,
-                    symptom_list=safe_eval_list(row['symptom_list']),
-                    pmh_list=safe_eval_list(row['pmh_list']),
-                    current_medications=safe_eval_list(row['current_medications']),
-                    allergies=safe_eval_list(row['allergies']),
-                    chief_complaint=row['chief_complaint'] if pd.notna(row['chief_complaint']) else None,
-                    free_text_notes=row['free_text_notes'] if pd.notna(row['free_text_notes']) else None,
-                    target_disease=int(row['target_disease']),
-                    target_tests=safe_eval_list(row['target_tests']),
-                    target_medications=safe_eval_list(row['target_medications']),
-                    condition_name=row['condition_name'],
-                    data_source="csv_migration",
-                    quality_score=1.0,
-                    is_validated=True,
-                    created_by="migration_script"
-                )
-                validation_records.append(record)
-            except Exception as e:
-                logger.error(f"Error processing validation row {len(validation_records)}: {e}")
-                logger.error(f"Row data: {row.to_dict()}")
-                continue
-        
-        # Bulk insert validation data
-        logger.info(f"Inserting {len(validation_records)} validation records...")
-        db.add_all(validation_records)
-        db.commit()
+        # Load with the secondary indexes dropped; each is rebuilt once at the end
+        tables = [model.__table__ for _, _, model, _ in DATASETS] + [training_symptoms]
+        with secondary_indexes_dropped(db, tables):
+            for label, csv_path, model, link_symptoms in DATASETS:
+                logger.info(f"Loading {label} data from {csv_path}")
+                found, inserted = migrate_csv_file(db, csv_path, model, label, link_symptoms)
+                csv_counts[label] = found
+                logger.info(f"Inserted {inserted} of {found} {label} samples")
         
         # Verify migration
         train_count = db.query(TrainingData).count()
@@ -158,44 +246,47 @@ def migrate_csv_to_database():
         logger.info(f"Training records in database: {train_count}")
         logger.info(f"Validation records in database: {val_count}")
         
-        # Show sample by condition
+        # Show sample by condition (one GROUP BY per table)
         logger.info("\nSample counts by condition:")
-        for condition in db.query(TrainingData.condition_name).distinct():
-            condition_name = condition[0]
-            train_condition_count = db.query(TrainingData).filter(TrainingData.condition_name == condition_name).count()
-            val_condition_count = db.query(ValidationData).filter(ValidationData.condition_name == condition_name).count()
+        train_counts = dict(db.query(TrainingData.condition_name, func.count()).group_by(TrainingData.condition_name).all())
+        val_counts = dict(db.query(ValidationData.condition_name, func.count()).group_by(ValidationData.condition_name).all())
+        for condition_name in sorted(train_counts.keys() | val_counts.keys()):
+            train_condition_count = train_counts.get(condition_name, 0)
+            val_condition_count = val_counts.get(condition_name, 0)
             logger.info(f"  {condition_name}: {train_condition_count} training, {val_condition_count} validation")
         
         db.close()
-        return True
+        return csv_counts
         
     except Exception as e:
         logger.error(f"Migration failed: {e}")
         if 'db' in locals():
             db.rollback()
             db.close()
-        return False
+        return None
+
+def count_csv_rows(path):
+    """Number of data rows in a CSV, streamed without building a DataFrame"""
+    with open(path, newline='') as f:
+        # csv.reader keeps quoted multi-line fields as one row, unlike a raw newline count
+        return sum(1 for _ in csv.reader(f)) - 1
 
-def verify_migration():
-    """Verify the migration was successful by comparing record counts"""
+def verify_migration(csv_counts=None):
+    """Verify the migration was successful by comparing record counts (CSV counts from the migration if given)"""
     try:
-        # Load CSV files
-        train_df = pd.read_csv("training/data/train_dataset.csv")
-        val_df = pd.read_csv("training/data/val_dataset.csv")
-        
-        # Query database
+        logger.info(f"\nMigration Verification:")
         db = SessionLocal()
-        train_db_count = db.query(TrainingData).count()
-        val_db_count = db.query(ValidationData).count()
+        all_match = True
+        for label, csv_path, model, _ in DATASETS:
+            # Compare CSV row counts with database row counts
+            csv_count = csv_counts[label] if csv_counts else count_csv_rows(csv_path)
+            db_count = db.query(model).count()
+            logger.info(f"CSV {label.capitalize()} records: {csv_count}")
+            logger.info(f"DB {label.capitalize()} records: {db_count}")
+            all_match = all_match and csv_count == db_count
         db.close()
         
-        logger.info(f"\nMigration Verification:")
-        logger.info(f"CSV Training records: {len(train_df)}")
-        logger.info(f"DB Training records: {train_db_count}")
-        logger.info(f"CSV Validation records: {len(val_df)}")
-        logger.info(f"DB Validation records: {val_db_count}")
-        
-        if len(train_df) == train_db_count and len(val_df) == val_db_count:
+        if all_match:
             logger.info("✅ Migration verification PASSED - All records migrated successfully!")
             return True
         else:
@@ -210,9 +301,10 @@ if __name__ == "__main__":
     logger.info("Starting training data migration from CSV to database...")
     
     # Run migration
-    if migrate_csv_to_database():
+    csv_counts = migrate_csv_to_database()
+    if csv_counts:
         # Verify migration
-        if verify_migration():
+        if verify_migration(csv_counts):
             logger.info("\n🎉 Training data migration completed successfully!")
             logger.info("You can now use the database-based training pipeline.")
         else:
@@ -4,8 +4,14 @@ Quick Fix Verification - Test the exact curl command that was failing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+# Keep-alive session, so repeated or looped checks reuse pooled connections
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 # The exact payload from the user's curl command
 test_payload = {
     "prediction_id": 123,
@@ -20,10 +26,9 @@ print("=" * 50)
 
 try:
     # Make the request
-    response = requests.post(
+    response = SESSION.post(
         "http://127.0.0.1:8000/api/v1/feedback/prediction-feedback",
-        json=test_payload,
-        headers={"Content-Type": "application/json"}
+        json=test_payload
     )
     
     print(f"Status Code: {response.status_code}")
@@ -4,7 +4,7 @@ Populates reference tables with comprehensive medical data
 """
 
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, make_url
 from app.database import Base, get_db
 from app.models import ICD10Code, MedicalTest, Medication
 from app.config import settings
@@ -222,7 +222,11 @@ MEDICATIONS_SEED_DATA = [
 
 def create_seeding_session():
     """Create database session for seeding"""
-    engine = create_engine(settings.database_url)
+    # psycopg2 sends executemany INSERTs as multi-row VALUES pages instead of one round-trip per row
+    engine = create_engine(
+        settings.database_url,
+        **({"executemany_mode": "values_plus_batch"} if make_url(settings.database_url).get_driver_name() == "psycopg2" else {})
+    )
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return SessionLocal()
 
@@ -231,17 +235,22 @@ def seed_icd10_codes(session):
     """Seed ICD-10 codes table"""
     print("🔄 Seeding ICD-10 codes...")
     
-    for icd_data in ICD10_SEED_DATA:
-        # Check if code already exists
-        existing = session.query(ICD10Code).filter(ICD10Code.code == icd_data["code"]).first()
-        if not existing:
-            icd10_record = ICD10Code(
-                code=icd_data["code"],
-                description=icd_data["description"],
-                category=icd_data["category"],
-                is_active=True
-            )
-            session.add(icd10_record)
+    # One query for the codes already present instead of one per seed row
+    seed_codes = [icd_data["code"] for icd_data in ICD10_SEED_DATA]
+    existing = {code for (code,) in session.query(ICD10Code.code).filter(ICD10Code.code.in_(seed_codes))}
+    new_rows = [
+        {
+            "code": icd_data["code"],
+            "description": icd_data["description"],
+            "category": icd_data["category"],
+            "is_active": True
+        }
+        for icd_data in ICD10_SEED_DATA
+        if icd_data["code"] not in existing
+    ]
+    # Bulk INSERT as one executemany; per-object flushes go row by row to read back created_at
+    if new_rows:
+        session.execute(insert(ICD10Code), new_rows)
     
     session.commit()
     count = session.query(ICD10Code).count()
@@ -252,19 +261,22 @@ def seed_medical_tests(session):
     """Seed medical tests table"""
     print("🔄 Seeding medical tests...")
     
-    for test_data in MEDICAL_TESTS_SEED_DATA:
-        # Check if test already exists
-        existing = session.query(MedicalTest).filter(MedicalTest.test_code == test_data["test_code"]).first()
-        if not existing:
-            test_record = MedicalTest(
-                test_name=test_data["test_name"],
-                test_code=test_data["test_code"],
-                description=test_data["description"],
-                category=test_data["category"],
-                typical_range=test_data["typical_range"],
-                is_active=True
-            )
-            session.add(test_record)
+    seed_codes = [test_data["test_code"] for test_data in MEDICAL_TESTS_SEED_DATA]
+    existing = {code for (code,) in session.query(MedicalTest.test_code).filter(MedicalTest.test_code.in_(seed_codes))}
+    new_rows = [
+        {
+            "test_name": test_data["test_name"],
+            "test_code": test_data["test_code"],
+            "description": test_data["description"],
+            "category": test_data["category"],
+            "typical_range": test_data["typical_range"],
+            "is_active": True
+        }
+        for test_data in MEDICAL_TESTS_SEED_DATA
+        if test_data["test_code"] not in existing
+    ]
+    if new_rows:
+        session.execute(insert(MedicalTest), new_rows)
     
     session.commit()
     count = session.query(MedicalTest).count()
@@ -275,21 +287,26 @@ def seed_medications(session):
     """Seed medications table"""
     print("🔄 Seeding medications...")
     
-    for med_data in MEDICATIONS_SEED_DATA:
-        # Check if medication already exists
-        existing = session.query(Medication).filter(Medication.medication_name == med_data["medication_name"]).first()
-        if not existing:
-            medication_record = Medication(
-                medication_name=med_data["medication_name"],
-                generic_name=med_data["generic_name"],
-                brand_names=med_data["brand_names"],
-                drug_class=med_data["drug_class"],
-                typical_dosage=med_data["typical_dosage"],
-                contraindications=med_data["contraindications"],
-                side_effects=med_data["side_effects"],
-                is_active=True
-            )
-            session.add(medication_record)
+    seed_names = [med_data["medication_name"] for med_data in MEDICATIONS_SEED_DATA]
+    existing = {
+        name for (name,) in session.query(Medication.medication_name).filter(Medication.medication_name.in_(seed_names))
+    }
+    new_rows = [
+        {
+            "medication_name": med_data["medication_name"],
+            "generic_name": med_data["generic_name"],
+            "brand_names": med_data["brand_names"],
+            "drug_class": med_data["drug_class"],
+            "typical_dosage": med_data["typical_dosage"],
+            "contraindications": med_data["contraindications"],
+            "side_effects": med_data["side_effects"],
+            "is_active": True
+        }
+        for med_data in MEDICATIONS_SEED_DATA
+        if med_data["medication_name"] not in existing
+    ]
+    if new_rows:
+        session.execute(insert(Medication), new_rows)
     
     session.commit()
     count = session.query(Medication).count()
@@ -7,7 +7,7 @@ Provides tools for managing training and validation datasets directly in the dat
 import json
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy import create_engine, func, text
+from sqlalchemy import create_engine, delete, func, insert, text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import logging
@@ -18,7 +18,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.models import TrainingData, ValidationData, ICD10Code, MedicalTest, Medication
+from app.models import TrainingData, ValidationData, ICD10Code, MedicalTest, Medication, training_symptoms
 from app.database import Base
 
 # Setup logging
@@ -33,7 +33,7 @@ class TrainingDataManager:
     
     def __init__(self, database_url: str = "sqlite:///./pdpcds_dev.db"):
         self.database_url = database_url
-        self.engine = create_engine(database_url)
+        self.engine = create_engine(database_url, insertmanyvalues_page_size=10_000)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
     def get_session(self):
@@ -335,51 +335,29 @@ class TrainingDataManager:
                 new_train_samples.extend(condition_train)
                 new_val_samples.extend(condition_val)
             
-            # Clear existing data
+            # Clear existing data; SQLite doesn't enforce the junction's ON DELETE CASCADE
+            # by default, so its rows are cleared explicitly
+            db.execute(delete(training_symptoms))
             db.query(TrainingData).delete()
             db.query(ValidationData).delete()
             
-            # Add rebalanced training data
-            for sample_info in new_train_samples:
-                original_data = sample_info['data']
-                
-                if sample_info['type'] == 'training':
-                    # Already training data, just re-add
-                    new_record = TrainingData(**{
-                        attr: getattr(original_data, attr) 
-                        for attr in TrainingData.__table__.columns.keys() 
-                        if attr != 'id'
-                    })
-                else:
-                    # Convert from validation to training
-                    new_record = TrainingData(**{
-                        attr: getattr(original_data, attr)
-                        for attr in ValidationData.__table__.columns.keys()
-                        if attr != 'id' and hasattr(TrainingData, attr)
-                    })
-                
-                db.add(new_record)
-            
-            # Add rebalanced validation data
-            for sample_info in new_val_samples:
-                original_data = sample_info['data']
-                
-                if sample_info['type'] == 'validation':
-                    # Already validation data, just re-add
-                    new_record = ValidationData(**{
-                        attr: getattr(original_data, attr)
-                        for attr in ValidationData.__table__.columns.keys()
-                        if attr != 'id'
-                    })
-                else:
-                    # Convert from training to validation
-                    new_record = ValidationData(**{
-                        attr: getattr(original_data, attr)
-                        for attr in TrainingData.__table__.columns.keys()
-                        if attr != 'id' and hasattr(ValidationData, attr)
-                    })
-                
-                db.add(new_record)
+            # Training and validation tables share the same data columns
+            data_columns = [attr for attr in TrainingData.__table__.columns.keys() if attr != 'id']
+            
+            # Add rebalanced training data through the ORM so the flush still links
+            # training_symptoms; the flush batches these into multi-row INSERTs
+            db.add_all([
+                TrainingData(**{attr: getattr(sample_info['data'], attr) for attr in data_columns})
+                for sample_info in new_train_samples
+            ])
+            
+            # Add rebalanced validation data as a single executemany INSERT
+            validation_rows = [
+                {attr: getattr(sample_info['data'], attr) for attr in data_columns}
+                for sample_info in new_val_samples
+            ]
+            if validation_rows:
+                db.execute(insert(ValidationData), validation_rows)
             
             db.commit()
             